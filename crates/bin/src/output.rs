@@ -1,5 +1,7 @@
 //! Output formatting helpers for human-readable and JSON output.
 
+use std::fmt::Write as _;
+
 /// Output format selection
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
 pub enum OutputFormat {
@@ -24,22 +26,32 @@ pub fn print_table(headers: &[&str], rows: &[Vec<String>]) {
         }
     }
 
-    // Print header
-    let header_line: Vec<String> = headers
-        .iter()
-        .enumerate()
-        .map(|(i, h)| format!("{:<width$}", h, width = widths[i]))
-        .collect();
-    println!("{}", header_line.join("  "));
-
-    // Print rows
+    // Render the whole table into one buffer so it reaches stdout in a single
+    // write, rather than locking and flushing stdout once per line.
+    let mut out = String::new();
+    push_line(&mut out, headers.iter().copied(), &widths);
     for row in rows {
-        let line: Vec<String> = row
-            .iter()
-            .enumerate()
-            .take(col_count)
-            .map(|(i, cell)| format!("{:<width$}", cell, width = widths[i]))
-            .collect();
-        println!("{}", line.join("  "));
+        push_line(
+            &mut out,
+            row.iter().take(col_count).map(String::as_str),
+            &widths,
+        );
+    }
+
+    print!("{out}");
+}
+
+/// Append one padded, two-space separated table line to `out`.
+///
+/// Cells are padded directly into the buffer, so no per-cell or per-line
+/// strings are allocated.
+fn push_line<'a>(out: &mut String, cells: impl Iterator<Item = &'a str>, widths: &[usize]) {
+    for (i, cell) in cells.enumerate() {
+        if i > 0 {
+            out.push_str("  ");
+        }
+        // Writing to a String cannot fail
+        let _ = write!(out, "{:<width$}", cell, width = widths[i]);
     }
+    out.push('\n');
 }
@@ -273,26 +273,19 @@ async fn update_tips_for_entry(
     tree_id: &ID,
     entry: &Entry,
 ) -> Result<()> {
-    // Check if this entry already has children in the tree (out-of-order arrival)
-    let has_tree_children: Option<(i32,)> =
-        sqlx::query_as("SELECT 1 FROM tree_parents WHERE parent_id = $1 LIMIT 1")
-            .bind(entry_id.to_string())
-            .fetch_optional(&mut **tx)
-            .await
-            .sql_context("Failed to check for tree children")?;
-
-    // Only add as tree-level tip if no children exist
+    // Add as tree-level tip unless this entry already has children in the tree
+    // (out-of-order arrival).
     // Note: empty string '' used for tree-level (PostgreSQL doesn't allow NULL in PK)
-    if has_tree_children.is_none() {
-        insert_or_ignore(
-            backend,
-            tx,
-            "tips",
-            &["entry_id", "tree_id", "store_name"],
-            &[entry_id.to_string(), tree_id.to_string(), String::new()],
-        )
-        .await?;
-    }
+    insert_tip_if_childless(
+        backend,
+        tx,
+        entry_id,
+        tree_id,
+        "",
+        "SELECT 1 FROM tree_parents WHERE parent_id = $1",
+        "Failed to insert tree tip",
+    )
+    .await?;
 
     // Remove parents from tree tips (they now have children)
     if let Ok(parents) = entry.parents() {
@@ -311,31 +304,18 @@ async fn update_tips_for_entry(
 
     // Handle store-level tips
     for store_name in entry.subtrees() {
-        // Check if this entry already has children in this store (out-of-order arrival)
-        let has_store_children: Option<(i32,)> = sqlx::query_as(
-            "SELECT 1 FROM store_parents WHERE parent_id = $1 AND store_name = $2 LIMIT 1",
+        // Add as store-level tip unless this entry already has children in
+        // this store (out-of-order arrival)
+        insert_tip_if_childless(
+            backend,
+            tx,
+            entry_id,
+            tree_id,
+            &store_name,
+            "SELECT 1 FROM store_parents WHERE parent_id = $1 AND store_name = $3",
+            "Failed to insert store tip",
         )
-        .bind(entry_id.to_string())
-        .bind(&store_name)
-        .fetch_optional(&mut **tx)
-        .await
-        .sql_context("Failed to check for store children")?;
-
-        // Only add as store-level tip if no children exist in this store
-        if has_store_children.is_none() {
-            insert_or_ignore(
-                backend,
-                tx,
-                "tips",
-                &["entry_id", "tree_id", "store_name"],
-                &[
-                    entry_id.to_string(),
-                    tree_id.to_string(),
-                    store_name.clone(),
-                ],
-            )
-            .await?;
-        }
+        .await?;
 
         // Remove parents from store tips
         if let Ok(store_parents) = entry.subtree_parents(&store_name) {
@@ -356,6 +336,45 @@ async fn update_tips_for_entry(
     Ok(())
 }
 
+/// Insert `entry_id` as a tip unless `children_query` finds a child for it.
+///
+/// The child check and the insert run as one `INSERT ... SELECT ... WHERE NOT
+/// EXISTS` statement, so each tip costs a single round-trip instead of a probe
+/// followed by an insert. `children_query` may reference `$1` (entry id),
+/// `$2` (tree id) and `$3` (store name, `''` for tree-level tips).
+async fn insert_tip_if_childless(
+    backend: &SqlxBackend,
+    tx: &mut sqlx::Transaction<'_, sqlx::Any>,
+    entry_id: &ID,
+    tree_id: &ID,
+    store_name: &str,
+    children_query: &str,
+    context: &str,
+) -> Result<()> {
+    let sql = if backend.is_sqlite() {
+        format!(
+            "INSERT OR IGNORE INTO tips (entry_id, tree_id, store_name)
+             SELECT $1, $2, $3 WHERE NOT EXISTS ({children_query})"
+        )
+    } else {
+        format!(
+            "INSERT INTO tips (entry_id, tree_id, store_name)
+             SELECT $1, $2, $3 WHERE NOT EXISTS ({children_query})
+             ON CONFLICT DO NOTHING"
+        )
+    };
+
+    sqlx::query(&sql)
+        .bind(entry_id.to_string())
+        .bind(tree_id.to_string())
+        .bind(store_name)
+        .execute(&mut **tx)
+        .await
+        .sql_context(context)?;
+
+    Ok(())
+}
+
 /// Update the verification status of an entry.
 pub async fn update_verification_status(
     backend: &SqlxBackend,
@@ -9,7 +9,7 @@ use aes_gcm::{
     aead::{Aead, AeadCore, OsRng},
 };
 use argon2::{Argon2, password_hash::SaltString};
-use zeroize::Zeroize;
+use zeroize::{Zeroize, Zeroizing};
 
 use super::errors::UserError;
 use crate::{Result, auth::crypto::PrivateKey};
@@ -72,6 +72,38 @@ pub fn derive_encryption_key(password: impl AsRef<str>, salt: impl AsRef<str>) -
     Ok(key)
 }
 
+/// Run password-based key derivation on tokio's blocking thread pool.
+///
+/// Argon2id is deliberately CPU- and memory-hard (19 MiB, t=2 with the default
+/// parameters), so calling it inline from async code stalls the runtime worker
+/// and every task scheduled on it. `f` is anything that performs the
+/// derivation, e.g. [`derive_encryption_key`] or
+/// [`UserKeyManager::new`](super::key_manager::UserKeyManager::new).
+pub(crate) async fn run_key_derivation<T, F>(f: F) -> Result<T>
+where
+    F: FnOnce() -> Result<T> + Send + 'static,
+    T: Send + 'static,
+{
+    tokio::task::spawn_blocking(f)
+        .await
+        .map_err(|e| UserError::EncryptionFailed {
+            reason: format!("Key derivation task failed: {e}"),
+        })?
+}
+
+/// Async variant of [`derive_encryption_key`] for use from async code.
+///
+/// The password is copied into a zeroizing buffer so it can move to the
+/// blocking pool; see [`run_key_derivation`].
+pub(crate) async fn derive_encryption_key_async(
+    password: impl AsRef<str>,
+    salt: impl AsRef<str>,
+) -> Result<Vec<u8>> {
+    let password = Zeroizing::new(password.as_ref().to_string());
+    let salt = salt.as_ref().to_string();
+    run_key_derivation(move || derive_encryption_key(password.as_str(), salt)).await
+}
+
 /// Encrypt a private key with a password-derived encryption key.
 ///
 /// # Arguments
@@ -277,4 +309,16 @@ mod tests {
         // Nonces should be different
         assert_ne!(nonce1, nonce2);
     }
+
+    #[tokio::test]
+    #[cfg_attr(miri, ignore)] // Argon2 is extremely slow under Miri
+    async fn test_derive_encryption_key_async_matches_sync() {
+        let password = "password";
+        let salt = generate_salt();
+
+        let sync_key = derive_encryption_key(password, &salt).unwrap();
+        let async_key = derive_encryption_key_async(password, &salt).await.unwrap();
+
+        assert_eq!(sync_key, async_key);
+    }
 }
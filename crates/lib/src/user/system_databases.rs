@@ -3,10 +3,11 @@
 //! Creates and manages _users and _databases system databases.
 
 use handle_trait::Handle;
+use zeroize::Zeroizing;
 
 use super::{
     User,
-    crypto::{derive_encryption_key, encrypt_private_key},
+    crypto::{derive_encryption_key_async, encrypt_private_key, run_key_derivation},
     errors::UserError,
     key_manager::UserKeyManager,
     types::{KeyStorage, UserCredentials, UserInfo, UserKey, UserStatus},
@@ -236,7 +237,7 @@ pub async fn create_user(
     let (root_key, password_salt) = match password {
         Some(pwd) => {
             let salt_string = super::crypto::generate_salt();
-            let encryption_key = derive_encryption_key(pwd, &salt_string)?;
+            let encryption_key = derive_encryption_key_async(pwd, &salt_string).await?;
             let (ciphertext, nonce) = encrypt_private_key(&user_private_key, &encryption_key)?;
             (
                 KeyStorage::Encrypted {
@@ -389,7 +390,7 @@ pub async fn login_user(
                 .ok_or_else(|| UserError::PasswordRequired {
                     operation: "decrypt keys for password-protected user".to_string(),
                 })?;
-            let encryption_key = derive_encryption_key(pwd, salt)?;
+            let encryption_key = derive_encryption_key_async(pwd, salt).await?;
             super::crypto::decrypt_private_key(ciphertext, nonce, &encryption_key)?
         }
         (KeyStorage::Unencrypted { key }, None) => key.clone(),
@@ -487,7 +488,10 @@ pub(crate) async fn build_user_session(
             .password_salt
             .as_ref()
             .ok_or(UserError::InvalidPassword)?;
-        UserKeyManager::new(pwd, salt, all_keys)?
+        // Unlocking re-derives the password key; keep it off the async worker.
+        let pwd = Zeroizing::new(pwd.to_string());
+        let salt = salt.clone();
+        run_key_derivation(move || UserKeyManager::new(&pwd, &salt, all_keys)).await?
     } else {
         UserKeyManager::new_passwordless(all_keys)?
     };